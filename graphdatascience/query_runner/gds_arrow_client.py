@@ -98,7 +98,7 @@ class GdsArrowClient:
         if auth:
             self._auth_middleware = AuthMiddleware(auth)
 
-        self._flight_client = self._instantiate_flight_client()
+        self._flight_client: Optional[flight.FlightClient] = self._instantiate_flight_client()
 
     def _instantiate_flight_client(self) -> flight.FlightClient:
         location = (
@@ -582,7 +582,7 @@ class GdsArrowClient:
             collected_result = list(result)
             assert len(collected_result) == 1
 
-            return json.loads(collected_result[0].body.to_pybytes().decode())  # type: ignore
+            return json.loads(collected_result[0].body.to_pybytes())  # type: ignore
         except Exception as e:
             self.handle_flight_error(e)
             raise e  # unreachable
@@ -679,7 +679,8 @@ class GdsArrowClient:
             return arrow_table.to_pandas(types_mapper=pandas.ArrowDtype)  # type: ignore
         else:
             arrow_table = self._sanitize_arrow_table(arrow_table)
-            return arrow_table.to_pandas()  # type: ignore
+            # the columns are copied into numpy blocks, so let arrow release each buffer once it has been converted
+            return arrow_table.to_pandas(self_destruct=True, split_blocks=True)  # type: ignore
 
     def __enter__(self) -> GdsArrowClient:
         return self
@@ -693,8 +694,11 @@ class GdsArrowClient:
         self.close()
 
     def close(self) -> None:
-        if self._flight_client:
-            self._flight_client.close()
+        # the client is absent after unpickling and will be recreated lazily by `_client()` if used again
+        flight_client = getattr(self, "_flight_client", None)
+        if flight_client:
+            flight_client.close()
+            self._flight_client = None
 
     def _versioned_action_type(self, action_type: str) -> str:
         return self._arrow_endpoint_version.prefix() + action_type
@@ -800,6 +804,9 @@ class AuthMiddleware(ClientMiddleware):  # type: ignore
         self._auth = auth
         self._token: Optional[str] = None
         self._token_timestamp = 0
+        # the credentials do not change, so the basic auth header only needs to be encoded once
+        username, password = auth
+        self._basic_auth_header = "Basic " + base64.b64encode(f"{username}:{password}".encode("utf-8")).decode("ASCII")
 
     def token(self) -> Optional[str]:
         # check whether the token is older than 10 minutes. If so, reset it.
@@ -830,11 +837,8 @@ class AuthMiddleware(ClientMiddleware):  # type: ignore
     def sending_headers(self) -> dict[str, str]:
         token = self.token()
         if not token:
-            username, password = self._auth
-            auth_token = f"{username}:{password}"
-            auth_token = "Basic " + base64.b64encode(auth_token.encode("utf-8")).decode("ASCII")
             # There seems to be a bug, `authorization` must be lower key
-            return {"authorization": auth_token}
+            return {"authorization": self._basic_auth_header}
         else:
             return {"authorization": "Bearer " + token}
 
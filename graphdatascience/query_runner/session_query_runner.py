@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Optional
+from abc import abstractmethod
+from typing import Any, Optional, Protocol
 from uuid import uuid4
 
 from pandas import DataFrame
@@ -19,12 +20,33 @@ from .protocol.write_protocols import WriteProtocol
 from .query_runner import QueryRunner
 
 
+class SessionArrowClient(Protocol):
+    """
+    The part of the `GdsArrowClient` used by the `SessionQueryRunner`
+    """
+
+    @abstractmethod
+    def connection_info(self) -> tuple[str, int]:
+        pass
+
+    @abstractmethod
+    def request_token(self) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+
 class SessionQueryRunner(QueryRunner):
     GDS_REMOTE_PROJECTION_PROC_NAME = "gds.arrow.project"
 
     @staticmethod
     def create(
-        gds_query_runner: QueryRunner, db_query_runner: QueryRunner, arrow_client: GdsArrowClient, show_progress: bool
+        gds_query_runner: QueryRunner,
+        db_query_runner: QueryRunner,
+        arrow_client: SessionArrowClient,
+        show_progress: bool,
     ) -> SessionQueryRunner:
         return SessionQueryRunner(gds_query_runner, db_query_runner, arrow_client, show_progress)
 
@@ -32,7 +54,7 @@ class SessionQueryRunner(QueryRunner):
         self,
         gds_query_runner: QueryRunner,
         db_query_runner: QueryRunner,
-        arrow_client: GdsArrowClient,
+        arrow_client: SessionArrowClient,
         show_progress: bool,
     ):
         self._gds_query_runner = gds_query_runner
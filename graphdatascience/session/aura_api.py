@@ -7,7 +7,7 @@ import warnings
 from collections import defaultdict
 from datetime import timedelta
 from http import HTTPStatus
-from typing import Any, Optional
+from typing import Any, Mapping, Optional, Union
 from urllib.parse import urlparse
 
 import requests
@@ -37,18 +37,46 @@ class AuraApiError(Exception):
         self.message = message
 
 
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    Applies a default timeout to every request, as `requests` waits forever for a response unless told otherwise.
+    """
+
+    def __init__(self, timeout: tuple[float, float], *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._timeout = timeout
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Union[float, tuple[float, float], tuple[float, None], None] = None,
+        verify: Union[bool, str] = True,
+        cert: Union[bytes, str, tuple[Union[bytes, str], Union[bytes, str]], None] = None,
+        proxies: Optional[Mapping[str, str]] = None,
+    ) -> requests.Response:
+        if timeout is None:
+            timeout = self._timeout
+        return super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+
 class AuraApi:
     API_VERSION = "v1beta5"
+    # (connect, read) timeout in seconds for a single request to the Aura API
+    REQUEST_TIMEOUT = (10.0, 60.0)
 
     def __init__(
         self, client_id: str, client_secret: str, tenant_id: Optional[str] = None, aura_env: Optional[str] = None
     ) -> None:
         self._base_uri = AuraApi.base_uri(aura_env)
+        self._sessions_uri = f"{self._base_uri}/{AuraApi.API_VERSION}/data-science/sessions"
+        self._instances_uri = f"{self._base_uri}/v1/instances"
 
         self._request_session = self._init_request_session((client_id, client_secret))
         self._logger = logging.getLogger()
 
         self._tenant_id = tenant_id if tenant_id else self._get_tenant_id()
+        self._tenant_params = {"tenantId": self._tenant_id}
         self._tenant_details: Optional[TenantDetails] = None
 
     def _init_request_session(self, credentials: tuple[str, str]) -> requests.Session:
@@ -58,24 +86,26 @@ class AuraApi:
             oauth_url=f"{self._base_uri}/oauth/token", credentials=credentials, headers=request_session.headers
         )
         # dont retry on POST as its not idempotent
-        request_session.mount(
-            "https://",
-            HTTPAdapter(
-                max_retries=Retry(
-                    allowed_methods=["GET", "DELETE"],
-                    total=10,
-                    status_forcelist=[
-                        HTTPStatus.TOO_MANY_REQUESTS.value,
-                        HTTPStatus.INTERNAL_SERVER_ERROR.value,
-                        HTTPStatus.BAD_GATEWAY.value,
-                        HTTPStatus.SERVICE_UNAVAILABLE.value,
-                        HTTPStatus.GATEWAY_TIMEOUT.value,
-                    ],
-                    backoff_factor=0.1,
-                )
+        request_session.mount("https://", AuraApi._http_adapter(allowed_methods=["GET", "DELETE"], total_retries=10))
+        return request_session
+
+    @staticmethod
+    def _http_adapter(allowed_methods: list[str], total_retries: int) -> HTTPAdapter:
+        return _TimeoutHTTPAdapter(
+            timeout=AuraApi.REQUEST_TIMEOUT,
+            max_retries=Retry(
+                allowed_methods=allowed_methods,
+                total=total_retries,
+                status_forcelist=[
+                    HTTPStatus.TOO_MANY_REQUESTS.value,
+                    HTTPStatus.INTERNAL_SERVER_ERROR.value,
+                    HTTPStatus.BAD_GATEWAY.value,
+                    HTTPStatus.SERVICE_UNAVAILABLE.value,
+                    HTTPStatus.GATEWAY_TIMEOUT.value,
+                ],
+                backoff_factor=0.1,
             ),
         )
-        return request_session
 
     @staticmethod
     def extract_id(uri: str) -> str:
@@ -117,9 +147,7 @@ class AuraApi:
             json["cloud_provider"] = cloud_location.provider
             json["region"] = cloud_location.region
 
-        response = self._request_session.post(
-            f"{self._base_uri}/{AuraApi.API_VERSION}/data-science/sessions", json=json
-        )
+        response = self._request_session.post(self._sessions_uri, json=json)
 
         self._check_resp(response)
 
@@ -127,9 +155,7 @@ class AuraApi:
         return SessionDetails.from_json(raw_json["data"], raw_json.get("errors", []))
 
     def get_session(self, session_id: str) -> Optional[SessionDetails]:
-        response = self._request_session.get(
-            f"{self._base_uri}/{AuraApi.API_VERSION}/data-science/sessions/{session_id}"
-        )
+        response = self._request_session.get(f"{self._sessions_uri}/{session_id}")
 
         if response.status_code == HTTPStatus.NOT_FOUND.value:
             return None
@@ -146,9 +172,7 @@ class AuraApi:
             "instanceId": dbid,
         }
 
-        response = self._request_session.get(
-            f"{self._base_uri}/{AuraApi.API_VERSION}/data-science/sessions", params=params
-        )
+        response = self._request_session.get(self._sessions_uri, params=params)
 
         self._check_resp(response)
 
@@ -168,8 +192,10 @@ class AuraApi:
         max_sleep_time: float = 10,
         max_wait_time: float = math.inf,
     ) -> WaitResult:
-        waited_time = 0.0
-        while waited_time < max_wait_time:
+        # measure wall-clock time so that slow or retried requests count towards `max_wait_time`
+        deadline = time.monotonic() + max_wait_time
+        # always check at least once, even if the deadline has already passed
+        while True:
             session = self.get_session(session_id)
             if session is None:
                 return WaitResult.from_error(f"Session `{session_id}` not found -- please retry")
@@ -177,27 +203,30 @@ class AuraApi:
                 return WaitResult.from_connection_url(session.bolt_connection_url())
             elif session.status == "Failed":
                 return WaitResult.from_error(f"Session `{session_id}` failed due to: {session.errors}")
-            else:
-                self._logger.debug(
-                    f"Session `{session_id}` is not yet running. "
-                    f"Current status: {session.status} Host: {session.host}. "
-                    f"Retrying in {sleep_time} seconds..."
-                )
-            waited_time += sleep_time
-            time.sleep(sleep_time)
-            sleep_time = min(sleep_time * 2, max_sleep_time, max_wait_time - waited_time)
+
+            remaining_time = deadline - time.monotonic()
+            if remaining_time <= 0:
+                break
+            wait_time = min(sleep_time, remaining_time)
+            self._logger.debug(
+                "Session `%s` is not yet running. Current status: %s Host: %s. Retrying in %s seconds...",
+                session_id,
+                session.status,
+                session.host,
+                wait_time,
+            )
+            time.sleep(wait_time)
+            sleep_time = min(sleep_time * 2, max_sleep_time)
 
         return WaitResult.from_error(
-            f"Session `{session_id}` is not running after {waited_time} seconds.\n"
+            f"Session `{session_id}` is not running after {max_wait_time} seconds.\n"
             "\tThe session may become available at a later time.\n"
             f'\tConsider running `sessions.delete(session_id="{session_id}")` '
             "to avoid resource leakage."
         )
 
     def delete_session(self, session_id: str) -> bool:
-        response = self._request_session.delete(
-            f"{self._base_uri}/{AuraApi.API_VERSION}/data-science/sessions/{session_id}",
-        )
+        response = self._request_session.delete(f"{self._sessions_uri}/{session_id}")
         self._check_endpoint_deprecation(response)
 
         if response.status_code == HTTPStatus.NOT_FOUND.value:
@@ -219,14 +248,14 @@ class AuraApi:
             "cloud_provider": cloud_provider,
         }
 
-        response = self._request_session.post(f"{self._base_uri}/v1/instances", json=data)
+        response = self._request_session.post(self._instances_uri, json=data)
 
         self._check_resp(response)
 
         return InstanceCreateDetails.from_json(response.json()["data"])
 
     def delete_instance(self, instance_id: str) -> Optional[InstanceSpecificDetails]:
-        response = self._request_session.delete(f"{self._base_uri}/v1/instances/{instance_id}")
+        response = self._request_session.delete(f"{self._instances_uri}/{instance_id}")
 
         if response.status_code == HTTPStatus.NOT_FOUND.value:
             return None
@@ -236,16 +265,16 @@ class AuraApi:
         return InstanceSpecificDetails.fromJson(response.json()["data"])
 
     def list_instances(self) -> list[InstanceDetails]:
-        response = self._request_session.get(f"{self._base_uri}/v1/instances", params={"tenantId": self._tenant_id})
+        response = self._request_session.get(self._instances_uri, params=self._tenant_params)
 
         self._check_resp(response)
 
         raw_data = response.json()["data"]
 
-        return [InstanceDetails.fromJson(i) for i in raw_data]
+        return list(map(InstanceDetails.fromJson, raw_data))
 
     def list_instance(self, instance_id: str) -> Optional[InstanceSpecificDetails]:
-        response = self._request_session.get(f"{self._base_uri}/v1/instances/{instance_id}")
+        response = self._request_session.get(f"{self._instances_uri}/{instance_id}")
 
         if response.status_code == HTTPStatus.NOT_FOUND.value:
             return None
@@ -259,8 +288,9 @@ class AuraApi:
     def wait_for_instance_running(
         self, instance_id: str, sleep_time: float = 0.2, max_sleep_time: float = 10, max_wait_time: float = 300
     ) -> WaitResult:
-        waited_time = 0.0
-        while waited_time < max_wait_time:
+        deadline = time.monotonic() + max_wait_time
+        # always check at least once, even if the deadline has already passed
+        while True:
             instance = self.list_instance(instance_id)
             if instance is None:
                 return WaitResult.from_error("Instance is not found -- please retry")
@@ -268,17 +298,21 @@ class AuraApi:
                 return WaitResult.from_error("Instance is being deleted")
             elif instance.status == "running":
                 return WaitResult.from_connection_url(instance.connection_url)
-            else:
-                self._logger.debug(
-                    f"Instance `{instance_id}` is not yet running. "
-                    f"Current status: {instance.status}. "
-                    f"Retrying in {sleep_time} seconds..."
-                )
-            waited_time += sleep_time
-            time.sleep(sleep_time)
-            sleep_time = min(sleep_time * 2, max_sleep_time, max_wait_time - waited_time)
 
-        return WaitResult.from_error(f"Instance is not running after waiting for {waited_time} seconds")
+            remaining_time = deadline - time.monotonic()
+            if remaining_time <= 0:
+                break
+            wait_time = min(sleep_time, remaining_time)
+            self._logger.debug(
+                "Instance `%s` is not yet running. Current status: %s. Retrying in %s seconds...",
+                instance_id,
+                instance.status,
+                wait_time,
+            )
+            time.sleep(wait_time)
+            sleep_time = min(sleep_time * 2, max_sleep_time)
+
+        return WaitResult.from_error(f"Instance is not running after waiting for {max_wait_time} seconds")
 
     def estimate_size(
         self, node_count: int, relationship_count: int, algorithm_categories: list[AlgorithmCategory]
@@ -290,7 +324,7 @@ class AuraApi:
             "instance_type": "dsenterprise",
         }
 
-        response = self._request_session.post(f"{self._base_uri}/v1/instances/sizing", json=data)
+        response = self._request_session.post(f"{self._instances_uri}/sizing", json=data)
         self._check_resp(response)
 
         return EstimationDetails.from_json(response.json()["data"])
@@ -316,6 +350,11 @@ class AuraApi:
             self._tenant_details = TenantDetails.from_json(response.json()["data"])
         return self._tenant_details
 
+    def close(self) -> None:
+        if isinstance(self._request_session.auth, AuraApi.Auth):
+            self._request_session.auth.close()
+        self._request_session.close()
+
     def _check_resp(self, resp: requests.Response) -> None:
         self._check_status_code(resp)
         self._check_endpoint_deprecation(resp)
@@ -341,10 +380,12 @@ class AuraApi:
             access_token: str
             expires_in: int
             token_type: str
+            authorization_header: str
 
             def __init__(self, json: dict[str, Any]) -> None:
                 self.access_token = json["access_token"]
                 self.token_type = json["token_type"]
+                self.authorization_header = f"Bearer {self.access_token}"
 
                 expires_in: int = json["expires_in"]
                 refresh_in: int = expires_in if expires_in <= 10 else expires_in - 10
@@ -363,34 +404,25 @@ class AuraApi:
 
         def _init_request_session(self, headers: dict[str, Any]) -> requests.Session:
             request_session = requests.Session()
-            request_session.mount(
-                "https://",
-                HTTPAdapter(
-                    max_retries=Retry(
-                        allowed_methods=["POST"],  # auth POST request is okay to retry
-                        total=5,
-                        status_forcelist=[
-                            HTTPStatus.TOO_MANY_REQUESTS.value,
-                            HTTPStatus.INTERNAL_SERVER_ERROR.value,
-                            HTTPStatus.BAD_GATEWAY.value,
-                            HTTPStatus.SERVICE_UNAVAILABLE.value,
-                            HTTPStatus.GATEWAY_TIMEOUT.value,
-                        ],
-                        backoff_factor=0.1,
-                    )
-                ),
-            )
+            # auth POST request is okay to retry
+            request_session.mount("https://", AuraApi._http_adapter(allowed_methods=["POST"], total_retries=5))
             request_session.headers = headers
             return request_session
 
         def __call__(self, r: requests.PreparedRequest) -> requests.PreparedRequest:
-            r.headers["Authorization"] = f"Bearer {self._auth_token()}"
+            r.headers["Authorization"] = self._valid_token().authorization_header
             return r
 
+        def close(self) -> None:
+            self._request_session.close()
+
         def _auth_token(self) -> str:
+            return self._valid_token().access_token
+
+        def _valid_token(self) -> AuraApi.Auth.Token:
             if self._token is None or self._token.should_refresh():
                 self._token = self._update_token()
-            return self._token.access_token
+            return self._token
 
         def _update_token(self) -> AuraApi.Auth.Token:
             data = {
@@ -124,6 +124,9 @@ class DedicatedSessions:
 
         return [SessionInfo.from_session_details(i) for i in sessions]
 
+    def close(self) -> None:
+        self._aura_api.close()
+
     def _find_existing_session(self, session_name: str) -> Optional[SessionDetails]:
         matched_sessions: list[SessionDetails] = []
         matched_sessions = [s for s in self._aura_api.list_sessions() if s.name == session_name]
@@ -133,3 +133,10 @@ class GdsSessions:
             A list of SessionInfo objects representing the GDS sessions.
         """
         return self._impl.list()
+
+    def close(self) -> None:
+        """
+        Closes the connections to the Aura API.
+        Sessions created by this instance are not affected and remain usable.
+        """
+        self._impl.close()
@@ -28,7 +28,7 @@ AURA_DB_URI = os.environ.get("AURA_DB_URI", "bolt://localhost:7687")
 AURA_DB_AUTH = ("neo4j", "password")
 
 
-@pytest.fixture(scope="package", autouse=False)
+@pytest.fixture(scope="session", autouse=False)
 def neo4j_driver() -> Generator[Driver, None, None]:
     driver = GraphDatabase.driver(URI, auth=AUTH)
 
@@ -37,7 +37,7 @@ def neo4j_driver() -> Generator[Driver, None, None]:
     driver.close()
 
 
-@pytest.fixture(scope="package", autouse=False)
+@pytest.fixture(scope="session", autouse=False)
 def runner(neo4j_driver: Driver) -> Generator[Neo4jQueryRunner, None, None]:
     _runner = Neo4jQueryRunner.create_for_db(neo4j_driver)
     _runner.set_database(DB)
@@ -47,7 +47,7 @@ def runner(neo4j_driver: Driver) -> Generator[Neo4jQueryRunner, None, None]:
     _runner.close()
 
 
-@pytest.fixture(scope="package", autouse=False)
+@pytest.fixture(scope="session", autouse=False)
 def gds() -> Generator[GraphDataScience, None, None]:
     _gds = GraphDataScience(URI, auth=AUTH)
     _gds.set_database(DB)
@@ -57,7 +57,16 @@ def gds() -> Generator[GraphDataScience, None, None]:
     _gds.close()
 
 
-@pytest.fixture(scope="package", autouse=False)
+@pytest.fixture(scope="session", autouse=False)
+def gds_without_database() -> Generator[GraphDataScience, None, None]:
+    _gds = GraphDataScience(URI, auth=AUTH)
+
+    yield _gds
+
+    _gds.close()
+
+
+@pytest.fixture(scope="session", autouse=False)
 def gds_with_tls() -> Generator[GraphDataScience, None, None]:
     integration_test_dir = Path(__file__).resolve().parent
     cert = os.path.join(integration_test_dir, "resources", "arrow-flight-gds-test.crt")
@@ -79,7 +88,7 @@ def gds_with_tls() -> Generator[GraphDataScience, None, None]:
     _gds.close()
 
 
-@pytest.fixture(scope="package", autouse=False)
+@pytest.fixture(scope="session", autouse=False)
 def gds_without_arrow() -> Generator[GraphDataScience, None, None]:
     _gds = GraphDataScience(URI, auth=AUTH, arrow=False)
     _gds.set_database(DB)
@@ -89,7 +98,7 @@ def gds_without_arrow() -> Generator[GraphDataScience, None, None]:
     _gds.close()
 
 
-@pytest.fixture(scope="package", autouse=False)
+@pytest.fixture(scope="session", autouse=False)
 def gds_with_cloud_setup(request: pytest.FixtureRequest) -> Generator[AuraGraphDataScience, None, None]:
     _gds = AuraGraphDataScience.create(
         gds_session_connection_info=DbmsConnectionInfo(URI, AUTH[0], AUTH[1]),
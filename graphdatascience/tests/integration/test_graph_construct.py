@@ -7,7 +7,6 @@ from pandas import DataFrame
 from graphdatascience.graph_data_science import GraphDataScience
 from graphdatascience.query_runner.arrow_query_runner import ArrowQueryRunner
 from graphdatascience.server_version.server_version import ServerVersion
-from graphdatascience.tests.integration.conftest import AUTH, URI
 
 GRAPH_NAME = "g"
 
@@ -493,10 +492,9 @@ def test_graph_construct_with_arrow_abort(gds: GraphDataScience) -> None:
 
 @pytest.mark.enterprise
 @pytest.mark.compatible_with(min_inclusive=ServerVersion(2, 1, 0))
-def test_graph_construct_with_arrow_no_db() -> None:
-    gds = GraphDataScience(URI, auth=AUTH)
+def test_graph_construct_with_arrow_no_db(gds_without_database: GraphDataScience) -> None:
+    gds = gds_without_database
     if not isinstance(gds._query_runner, ArrowQueryRunner):
-        gds.close()
         pytest.skip("Arrow server not enabled")
 
     assert not gds.database()
@@ -506,7 +504,6 @@ def test_graph_construct_with_arrow_no_db() -> None:
 
     with pytest.raises(ValueError):
         gds.graph.construct("hello", nodes, relationships)
-    gds.close()  # explicitly close the driver to avoid driver leakage warning (only for some versions?)
 
 
 @pytest.mark.filterwarnings("ignore: GDS Enterprise users can use Apache Arrow")
@@ -9,7 +9,7 @@ from graphdatascience.graph_data_science import GraphDataScience
 from graphdatascience.query_runner.arrow_query_runner import ArrowQueryRunner
 from graphdatascience.query_runner.query_runner import QueryRunner
 from graphdatascience.server_version.server_version import ServerVersion
-from graphdatascience.tests.integration.conftest import AUTH, DB, URI
+from graphdatascience.tests.integration.conftest import DB
 
 GRAPH_NAME = "g"
 
@@ -32,9 +32,7 @@ def run_around_tests(gds: GraphDataScience) -> Generator[None, None, None]:
 
     yield  # Test runs here
 
-    # Runs after each test
-    gds.run_cypher("MATCH (n) DETACH DELETE n")
-    gds.graph.drop(GRAPH_NAME, failIfMissing=False)
+    # The data and all projected graphs are removed after each test by the `clean_up` fixture in conftest.py
 
 
 def test_project_graph_native(gds: GraphDataScience) -> None:
@@ -294,7 +292,7 @@ def test_graph_streamNodeProperty_with_arrow(gds: GraphDataScience) -> None:
 
     with pytest.warns(DeprecationWarning):
         result = gds.graph.streamNodeProperty(G, "x", concurrency=2)
-    assert {e for e in result["propertyValue"]} == {1, 2, 3}
+    assert set(result["propertyValue"].unique()) == {1, 2, 3}
 
 
 @pytest.mark.compatible_with(min_inclusive=ServerVersion(2, 2, 0))
@@ -302,14 +300,13 @@ def test_graph_nodeProperty_stream(gds: GraphDataScience) -> None:
     G, _ = gds.graph.project(GRAPH_NAME, {"Node": {"properties": "x"}}, "*")
 
     result = gds.graph.nodeProperty.stream(G, "x", concurrency=2)
-    assert {e for e in result["propertyValue"]} == {1, 2, 3}
+    assert set(result["propertyValue"].unique()) == {1, 2, 3}
 
 
 @pytest.mark.compatible_with(max_exclusive=ServerVersion(2, 2, 0))
-def test_graph_streamNodeProperty_with_arrow_no_db() -> None:
-    gds = GraphDataScience(URI, auth=AUTH)
+def test_graph_streamNodeProperty_with_arrow_no_db(gds_without_database: GraphDataScience) -> None:
+    gds = gds_without_database
     if not isinstance(gds._query_runner, ArrowQueryRunner):
-        gds.close()
         pytest.skip("Arrow server not enabled")
 
     assert not gds.database()
@@ -317,14 +314,12 @@ def test_graph_streamNodeProperty_with_arrow_no_db() -> None:
 
     with pytest.raises(ValueError):
         gds.graph.streamNodeProperty(G, "x", concurrency=2)
-    gds.close()
 
 
 @pytest.mark.compatible_with(min_inclusive=ServerVersion(2, 2, 0))
-def test_graph_nodeProperty_stream_with_arrow_no_db() -> None:
-    gds = GraphDataScience(URI, auth=AUTH)
+def test_graph_nodeProperty_stream_with_arrow_no_db(gds_without_database: GraphDataScience) -> None:
+    gds = gds_without_database
     if not isinstance(gds._query_runner, ArrowQueryRunner):
-        gds.close()
         pytest.skip("Arrow server not enabled")
 
     assert not gds.database()
@@ -332,7 +327,6 @@ def test_graph_nodeProperty_stream_with_arrow_no_db() -> None:
 
     with pytest.raises(ValueError):
         gds.graph.nodeProperty.stream(G, "x", concurrency=2)
-    gds.close()
 
 
 def test_graph_streamNodeProperty_without_arrow(gds_without_arrow: GraphDataScience) -> None:
@@ -341,7 +335,7 @@ def test_graph_streamNodeProperty_without_arrow(gds_without_arrow: GraphDataScie
     with pytest.warns(DeprecationWarning):
         result = gds_without_arrow.graph.streamNodeProperty(G, "x", concurrency=2)
 
-    assert {e for e in result["propertyValue"]} == {1, 2, 3}
+    assert set(result["propertyValue"].unique()) == {1, 2, 3}
 
 
 @pytest.mark.compatible_with(min_inclusive=ServerVersion(2, 2, 0))
@@ -350,7 +344,7 @@ def test_graph_nodeProperty_stream_without_arrow(gds_without_arrow: GraphDataSci
 
     result = gds_without_arrow.graph.nodeProperty.stream(G, "x", concurrency=2)
 
-    assert {e for e in result["propertyValue"]} == {1, 2, 3}
+    assert set(result["propertyValue"].unique()) == {1, 2, 3}
 
 
 @pytest.mark.compatible_with(min_inclusive=ServerVersion(2, 2, 0))
@@ -362,7 +356,7 @@ def test_graph_nodeProperty_stream_db_properties(gds: GraphDataScience) -> None:
     assert {"nodeId", "nodeProperty", "propertyValue"}.issubset(set(result.keys()))
 
     x_values = result[result.nodeProperty == "x"]
-    assert {e for e in x_values["propertyValue"]} == {1, 2, 3}
+    assert set(x_values["propertyValue"].unique()) == {1, 2, 3}
 
     z_values = result[result.nodeProperty == "z"]
     assert len(z_values) == 3
@@ -370,7 +364,7 @@ def test_graph_nodeProperty_stream_db_properties(gds: GraphDataScience) -> None:
         assert e in [[9], [42], [1337]]
 
     name_values = result[result.nodeProperty == "name"]
-    assert {e for e in name_values["propertyValue"]} == {"nodeA", "nodeB", "nodeC"}
+    assert set(name_values["propertyValue"].unique()) == {"nodeA", "nodeB", "nodeC"}
 
 
 @pytest.mark.compatible_with(min_inclusive=ServerVersion(2, 2, 0))
@@ -382,7 +376,7 @@ def test_graph_nodeProperty_stream_db_properties_without_arrow(gds_without_arrow
     assert {"nodeId", "nodeProperty", "propertyValue"}.issubset(set(result.keys()))
 
     x_values = result[result.nodeProperty == "x"]
-    assert {e for e in x_values["propertyValue"]} == {1, 2, 3}
+    assert set(x_values["propertyValue"].unique()) == {1, 2, 3}
 
     z_values = result[result.nodeProperty == "z"]
     assert len(z_values) == 3
@@ -390,7 +384,7 @@ def test_graph_nodeProperty_stream_db_properties_without_arrow(gds_without_arrow
         assert e in [[9], [42], [1337]]
 
     name_values = result[result.nodeProperty == "name"]
-    assert {e for e in name_values["propertyValue"]} == {"nodeA", "nodeB", "nodeC"}
+    assert set(name_values["propertyValue"].unique()) == {"nodeA", "nodeB", "nodeC"}
 
 
 @pytest.mark.compatible_with(min_inclusive=ServerVersion(2, 2, 0))
@@ -420,10 +414,10 @@ def test_graph_nodeProperties_stream_with_arrow(gds: GraphDataScience) -> None:
     assert result.shape == (G.node_count() * 4, 3)  # 4 properties
 
     x_values = result[result.nodeProperty == "x"]
-    assert {e for e in x_values["propertyValue"]} == {1, 2, 3}
+    assert set(x_values["propertyValue"].unique()) == {1, 2, 3}
 
     y_values = result[result.nodeProperty == "y"]
-    assert {e for e in y_values["propertyValue"]} == {2, 3, 4}
+    assert set(y_values["propertyValue"].unique()) == {2, 3, 4}
 
     z_values = result[result.nodeProperty == "z"]
     assert len(z_values) == 3
@@ -431,7 +425,7 @@ def test_graph_nodeProperties_stream_with_arrow(gds: GraphDataScience) -> None:
         assert e in [[9], [42], [1337]]
 
     name_values = result[result.nodeProperty == "name"]
-    assert {e for e in name_values["propertyValue"]} == {"nodeA", "nodeB", "nodeC"}
+    assert set(name_values["propertyValue"].unique()) == {"nodeA", "nodeB", "nodeC"}
 
 
 @pytest.mark.enterprise
@@ -444,7 +438,7 @@ def test_graph_nodeProperties_stream_listNodeLabels_with_arrow(gds: GraphDataSci
     assert list(result.keys()) == ["nodeId", "nodeLabels", "nodeProperty", "propertyValue"]
 
     x_values = result[result.nodeProperty == "x"]
-    assert {e for e in x_values["propertyValue"]} == {1, 2, 3}
+    assert set(x_values["propertyValue"].unique()) == {1, 2, 3}
 
     assert [e for e in result["nodeLabels"]] == [["Node"], ["Node"], ["Node"]]
 
@@ -458,7 +452,7 @@ def test_graph_nodeProperties_stream_listNodeLabels(gds_without_arrow: GraphData
     assert list(result.keys()) == ["nodeId", "nodeProperty", "propertyValue", "nodeLabels"]
 
     x_values = result[result.nodeProperty == "x"]
-    assert {e for e in x_values["propertyValue"]} == {1, 2, 3}
+    assert set(x_values["propertyValue"].unique()) == {1, 2, 3}
 
     assert [e for e in result["nodeLabels"]] == [["Node"], ["Node"], ["Node"]]
 
@@ -485,8 +479,8 @@ def test_graph_streamNodeProperties_with_arrow_separate_property_columns(gds: Gr
     with pytest.warns(DeprecationWarning):
         result = gds.graph.streamNodeProperties(G, ["x", "y"], separate_property_columns=True, concurrency=2)
     assert list(result.keys()) == ["nodeId", "x", "y"]
-    assert {e for e in result["x"]} == {1, 2, 3}
-    assert {e for e in result["y"]} == {2, 3, 4}
+    assert set(result["x"].unique()) == {1, 2, 3}
+    assert set(result["y"].unique()) == {2, 3, 4}
 
 
 @pytest.mark.compatible_with(min_inclusive=ServerVersion(2, 2, 0))
@@ -497,12 +491,12 @@ def test_graph_nodeProperties_stream_with_arrow_separate_property_columns(gds: G
         G, ["x", "y"], db_node_properties=["z", "name"], separate_property_columns=True, concurrency=2
     )
     assert set(result.keys()) == {"nodeId", "x", "y", "z", "name"}
-    assert {e for e in result["x"]} == {1, 2, 3}
-    assert {e for e in result["y"]} == {2, 3, 4}
+    assert set(result["x"].unique()) == {1, 2, 3}
+    assert set(result["y"].unique()) == {2, 3, 4}
     assert len(result["z"]) == 3
     for e in result["z"]:
         assert e in [[9], [42], [1337]]
-    assert {e for e in result["name"]} == {"nodeA", "nodeB", "nodeC"}
+    assert set(result["name"].unique()) == {"nodeA", "nodeB", "nodeC"}
 
 
 @pytest.mark.compatible_with(min_inclusive=ServerVersion(2, 2, 0))
@@ -524,10 +518,10 @@ def test_graph_streamNodeProperties_without_arrow(gds_without_arrow: GraphDataSc
     assert {"nodeId", "nodeProperty", "propertyValue"}.issubset(set(result.keys()))
 
     x_values = result[result.nodeProperty == "x"]
-    assert {e for e in x_values["propertyValue"]} == {1, 2, 3}
+    assert set(x_values["propertyValue"].unique()) == {1, 2, 3}
 
     y_values = result[result.nodeProperty == "y"]
-    assert {e for e in y_values["propertyValue"]} == {2, 3, 4}
+    assert set(y_values["propertyValue"].unique()) == {2, 3, 4}
 
 
 @pytest.mark.compatible_with(min_inclusive=ServerVersion(2, 2, 0))
@@ -544,10 +538,10 @@ def test_graph_nodeProperties_stream_without_arrow(gds_without_arrow: GraphDataS
     assert result.shape == (G.node_count() * 4, 3 + 1)  # 4 properties
 
     x_values = result[result.nodeProperty == "x"]
-    assert {e for e in x_values["propertyValue"]} == {1, 2, 3}
+    assert set(x_values["propertyValue"].unique()) == {1, 2, 3}
 
     y_values = result[result.nodeProperty == "y"]
-    assert {e for e in y_values["propertyValue"]} == {2, 3, 4}
+    assert set(y_values["propertyValue"].unique()) == {2, 3, 4}
 
     z_values = result[result.nodeProperty == "z"]
     assert len(z_values) == 3
@@ -555,7 +549,7 @@ def test_graph_nodeProperties_stream_without_arrow(gds_without_arrow: GraphDataS
         assert e in [[9], [42], [1337]]
 
     name_values = result[result.nodeProperty == "name"]
-    assert {e for e in name_values["propertyValue"]} == {"nodeA", "nodeB", "nodeC"}
+    assert set(name_values["propertyValue"].unique()) == {"nodeA", "nodeB", "nodeC"}
 
 
 def test_graph_nodeProperties_fail_on_duplicate_node_properties(gds: GraphDataScience) -> None:
@@ -580,7 +574,7 @@ def test_graph_streamNodeProperties_without_arrow_separate_property_columns(
 
     assert list(result.keys()) == ["nodeId", "x", "z"]
 
-    assert {e for e in result["x"]} == {1, 2, 3}
+    assert set(result["x"].unique()) == {1, 2, 3}
 
     assert len(result["z"]) == 3
     for e in result["z"]:
@@ -599,12 +593,12 @@ def test_graph_nodeProperties_stream_without_arrow_separate_property_columns(
 
     assert set(result.keys()) == {"nodeId", "x", "y", "z", "name"}
 
-    assert {e for e in result["x"]} == {1, 2, 3}
-    assert {e for e in result["y"]} == {2, 3, 4}
+    assert set(result["x"].unique()) == {1, 2, 3}
+    assert set(result["y"].unique()) == {2, 3, 4}
     assert len(result["z"]) == 3
     for e in result["z"]:
         assert e in [[42], [1337], [9]]
-    assert {e for e in result["name"]} == {"nodeA", "nodeB", "nodeC"}
+    assert set(result["name"].unique()) == {"nodeA", "nodeB", "nodeC"}
 
 
 def test_graph_streamRelationshipProperty_with_arrow(gds: GraphDataScience) -> None:
@@ -612,7 +606,7 @@ def test_graph_streamRelationshipProperty_with_arrow(gds: GraphDataScience) -> N
 
     with pytest.warns(DeprecationWarning):
         result = gds.graph.streamRelationshipProperty(G, "relX", concurrency=2)
-    assert {e for e in result["propertyValue"]} == {4, 5, 6}
+    assert set(result["propertyValue"].unique()) == {4, 5, 6}
 
 
 @pytest.mark.compatible_with(min_inclusive=ServerVersion(2, 2, 0))
@@ -620,7 +614,7 @@ def test_graph_relationshipProperty_stream_with_arrow(gds: GraphDataScience) ->
     G, _ = gds.graph.project(GRAPH_NAME, "*", {"REL": {"properties": "relX"}})
 
     result = gds.graph.relationshipProperty.stream(G, "relX", concurrency=2)
-    assert {e for e in result["propertyValue"]} == {4, 5, 6}
+    assert set(result["propertyValue"].unique()) == {4, 5, 6}
 
 
 def test_graph_streamRelationshipProperty_without_arrow(gds_without_arrow: GraphDataScience) -> None:
@@ -628,7 +622,7 @@ def test_graph_streamRelationshipProperty_without_arrow(gds_without_arrow: Graph
 
     with pytest.warns(DeprecationWarning):
         result = gds_without_arrow.graph.streamRelationshipProperty(G, "relX", concurrency=2)
-    assert {e for e in result["propertyValue"]} == {4, 5, 6}
+    assert set(result["propertyValue"].unique()) == {4, 5, 6}
 
 
 @pytest.mark.compatible_with(min_inclusive=ServerVersion(2, 2, 0))
@@ -636,71 +630,39 @@ def test_graph_relationshipProperty_stream_without_arrow(gds_without_arrow: Grap
     G, _ = gds_without_arrow.graph.project(GRAPH_NAME, "*", {"REL": {"properties": "relX"}})
 
     result = gds_without_arrow.graph.relationshipProperty.stream(G, "relX", concurrency=2)
-    assert {e for e in result["propertyValue"]} == {4, 5, 6}
+    assert set(result["propertyValue"].unique()) == {4, 5, 6}
 
 
-def test_graph_streamRelationshipProperties_with_arrow(gds: GraphDataScience) -> None:
-    G, _ = gds.graph.project(GRAPH_NAME, "*", {"REL": {"properties": ["relX", "relY"]}})
-
-    with pytest.warns(DeprecationWarning):
-        result = gds.graph.streamRelationshipProperties(G, ["relX", "relY"], concurrency=2)
-
-    assert list(result.keys()) == [
-        "sourceNodeId",
-        "targetNodeId",
-        "relationshipType",
-        "relationshipProperty",
-        "propertyValue",
-    ]
-
-    x_values = result[result.relationshipProperty == "relX"]
-    assert {e for e in x_values["propertyValue"]} == {4, 5, 6}
-    y_values = result[result.relationshipProperty == "relY"]
-    assert {e for e in y_values["propertyValue"]} == {5, 6, 7}
-
-
-@pytest.mark.compatible_with(min_inclusive=ServerVersion(2, 2, 0))
-def test_graph_relationshipProperties_stream_with_arrow(gds: GraphDataScience) -> None:
-    G, _ = gds.graph.project(GRAPH_NAME, "*", {"REL": {"properties": ["relX", "relY"]}})
-
-    result = gds.graph.relationshipProperties.stream(G, ["relX", "relY"], concurrency=2)
-
-    assert list(result.keys()) == [
-        "sourceNodeId",
-        "targetNodeId",
-        "relationshipType",
-        "relationshipProperty",
-        "propertyValue",
-    ]
-
-    x_values = result[result.relationshipProperty == "relX"]
-    assert {e for e in x_values["propertyValue"]} == {4, 5, 6}
-    y_values = result[result.relationshipProperty == "relY"]
-    assert {e for e in y_values["propertyValue"]} == {5, 6, 7}
-
-
-def test_graph_streamRelationshipProperties_with_arrow_separate_property_columns(gds: GraphDataScience) -> None:
+@pytest.mark.parametrize("gds_fixture", ["gds", "gds_without_arrow"])
+@pytest.mark.parametrize("separate_property_columns", [False, True])
+def test_graph_streamRelationshipProperties(
+    gds_fixture: str, separate_property_columns: bool, request: pytest.FixtureRequest
+) -> None:
+    gds: GraphDataScience = request.getfixturevalue(gds_fixture)
     G, _ = gds.graph.project(GRAPH_NAME, "*", {"REL": {"properties": ["relX", "relY"]}})
 
     with pytest.warns(DeprecationWarning):
         result = gds.graph.streamRelationshipProperties(
-            G, ["relX", "relY"], separate_property_columns=True, concurrency=2
+            G, ["relX", "relY"], separate_property_columns=separate_property_columns, concurrency=2
         )
 
-    assert list(result.keys()) == ["sourceNodeId", "targetNodeId", "relationshipType", "relX", "relY"]
-    assert {e for e in result["relX"]} == {4, 5, 6}
-    assert {e for e in result["relY"]} == {5, 6, 7}
+    assert_relationship_properties_result(result, separate_property_columns)
 
 
 @pytest.mark.compatible_with(min_inclusive=ServerVersion(2, 2, 0))
-def test_graph_relationshipProperties_stream_with_arrow_separate_property_columns(gds: GraphDataScience) -> None:
+@pytest.mark.parametrize("gds_fixture", ["gds", "gds_without_arrow"])
+@pytest.mark.parametrize("separate_property_columns", [False, True])
+def test_graph_relationshipProperties_stream(
+    gds_fixture: str, separate_property_columns: bool, request: pytest.FixtureRequest
+) -> None:
+    gds: GraphDataScience = request.getfixturevalue(gds_fixture)
     G, _ = gds.graph.project(GRAPH_NAME, "*", {"REL": {"properties": ["relX", "relY"]}})
 
-    result = gds.graph.relationshipProperties.stream(G, ["relX", "relY"], separate_property_columns=True, concurrency=2)
+    result = gds.graph.relationshipProperties.stream(
+        G, ["relX", "relY"], separate_property_columns=separate_property_columns, concurrency=2
+    )
 
-    assert list(result.keys()) == ["sourceNodeId", "targetNodeId", "relationshipType", "relX", "relY"]
-    assert {e for e in result["relX"]} == {4, 5, 6}
-    assert {e for e in result["relY"]} == {5, 6, 7}
+    assert_relationship_properties_result(result, separate_property_columns)
 
 
 @pytest.mark.compatible_with(min_inclusive=ServerVersion(2, 2, 0))
@@ -718,9 +680,9 @@ def test_graph_relationshipProperties_stream_with_arrow_rel_as_str(gds: GraphDat
     ]
 
     x_values = result[result.relationshipProperty == "relX"]
-    assert {e for e in x_values["propertyValue"]} == {4, 5, 6}
+    assert set(x_values["propertyValue"].unique()) == {4, 5, 6}
     y_values = result[result.relationshipProperty == "relY"]
-    assert {e for e in y_values["propertyValue"]} == {5, 6, 7}
+    assert set(y_values["propertyValue"].unique()) == {5, 6, 7}
 
 
 @pytest.mark.compatible_with(min_inclusive=ServerVersion(2, 2, 0))
@@ -739,78 +701,8 @@ def test_graph_relationshipProperties_stream_with_arrow_rel_as_str_sep(gds: Grap
         "relY",
     ]
 
-    assert {e for e in result["relX"]} == {4, 5, 6}
-    assert {e for e in result["relY"]} == {5, 6, 7}
-
-
-def test_graph_streamRelationshipProperties_without_arrow(gds_without_arrow: GraphDataScience) -> None:
-    G, _ = gds_without_arrow.graph.project(GRAPH_NAME, "*", {"REL": {"properties": ["relX", "relY"]}})
-
-    with pytest.warns(DeprecationWarning):
-        result = gds_without_arrow.graph.streamRelationshipProperties(G, ["relX", "relY"], concurrency=2)
-
-    assert list(result.keys()) == [
-        "sourceNodeId",
-        "targetNodeId",
-        "relationshipType",
-        "relationshipProperty",
-        "propertyValue",
-    ]
-
-    x_values = result[result.relationshipProperty == "relX"]
-    assert {e for e in x_values["propertyValue"]} == {4, 5, 6}
-    y_values = result[result.relationshipProperty == "relY"]
-    assert {e for e in y_values["propertyValue"]} == {5, 6, 7}
-
-
-@pytest.mark.compatible_with(min_inclusive=ServerVersion(2, 2, 0))
-def test_graph_relationshipProperties_stream_without_arrow(gds_without_arrow: GraphDataScience) -> None:
-    G, _ = gds_without_arrow.graph.project(GRAPH_NAME, "*", {"REL": {"properties": ["relX", "relY"]}})
-
-    result = gds_without_arrow.graph.relationshipProperties.stream(G, ["relX", "relY"], concurrency=2)
-
-    assert list(result.keys()) == [
-        "sourceNodeId",
-        "targetNodeId",
-        "relationshipType",
-        "relationshipProperty",
-        "propertyValue",
-    ]
-
-    x_values = result[result.relationshipProperty == "relX"]
-    assert {e for e in x_values["propertyValue"]} == {4, 5, 6}
-    y_values = result[result.relationshipProperty == "relY"]
-    assert {e for e in y_values["propertyValue"]} == {5, 6, 7}
-
-
-def test_graph_streamRelationshipProperties_without_arrow_separate_property_columns(
-    gds_without_arrow: GraphDataScience,
-) -> None:
-    G, _ = gds_without_arrow.graph.project(GRAPH_NAME, "*", {"REL": {"properties": ["relX", "relY"]}})
-
-    with pytest.warns(DeprecationWarning):
-        result = gds_without_arrow.graph.streamRelationshipProperties(
-            G, ["relX", "relY"], separate_property_columns=True, concurrency=2
-        )
-
-    assert list(result.keys()) == ["sourceNodeId", "targetNodeId", "relationshipType", "relX", "relY"]
-    assert {e for e in result["relX"]} == {4, 5, 6}
-    assert {e for e in result["relY"]} == {5, 6, 7}
-
-
-@pytest.mark.compatible_with(min_inclusive=ServerVersion(2, 2, 0))
-def test_graph_relationshipProperties_stream_without_arrow_separate_property_columns(
-    gds_without_arrow: GraphDataScience,
-) -> None:
-    G, _ = gds_without_arrow.graph.project(GRAPH_NAME, "*", {"REL": {"properties": ["relX", "relY"]}})
-
-    result = gds_without_arrow.graph.relationshipProperties.stream(
-        G, ["relX", "relY"], separate_property_columns=True, concurrency=2
-    )
-
-    assert list(result.keys()) == ["sourceNodeId", "targetNodeId", "relationshipType", "relX", "relY"]
-    assert {e for e in result["relX"]} == {4, 5, 6}
-    assert {e for e in result["relY"]} == {5, 6, 7}
+    assert set(result["relX"].unique()) == {4, 5, 6}
+    assert set(result["relY"].unique()) == {5, 6, 7}
 
 
 @pytest.mark.compatible_with(min_inclusive=ServerVersion(2, 2, 0))
@@ -1046,7 +938,7 @@ def test_graph_nodeProperty_stream_via_run_query(gds: GraphDataScience) -> None:
             "YIELD nodeId AS id, propertyValue AS degree RETURN id, degree LIMIT 10"
         )
     )
-    assert {e for e in result["degree"]} == {1, 2, 3}
+    assert set(result["degree"].unique()) == {1, 2, 3}
 
 
 def test_empty_relationships_stream(gds: GraphDataScience) -> None:
@@ -1060,3 +952,23 @@ def test_empty_relationships_stream(gds: GraphDataScience) -> None:
 
     result = gds.graph.relationships.stream(G, ["SIMILAR"])
     assert result.empty
+
+
+def assert_relationship_properties_result(result: DataFrame, separate_property_columns: bool) -> None:
+    if separate_property_columns:
+        assert list(result.keys()) == ["sourceNodeId", "targetNodeId", "relationshipType", "relX", "relY"]
+        assert set(result["relX"].unique()) == {4, 5, 6}
+        assert set(result["relY"].unique()) == {5, 6, 7}
+    else:
+        assert list(result.keys()) == [
+            "sourceNodeId",
+            "targetNodeId",
+            "relationshipType",
+            "relationshipProperty",
+            "propertyValue",
+        ]
+
+        x_values = result[result.relationshipProperty == "relX"]
+        assert set(x_values["propertyValue"].unique()) == {4, 5, 6}
+        y_values = result[result.relationshipProperty == "relY"]
+        assert set(y_values["propertyValue"].unique()) == {5, 6, 7}
@@ -27,7 +27,7 @@ def test_disabled_progress_logging_session(neo4j_driver: Driver) -> None:
     query_runner = SessionQueryRunner.create(
         gds_query_runner,
         db_query_runner,
-        FakeArrowClient(),  # type: ignore
+        FakeArrowClient(),
         show_progress=False,
     )
     assert query_runner._resolve_show_progress(True) is False
@@ -41,7 +41,7 @@ def test_enabled_progress_logging_session(neo4j_driver: Driver) -> None:
     query_runner = SessionQueryRunner.create(
         gds_query_runner,
         db_query_runner,
-        FakeArrowClient(),  # type: ignore
+        FakeArrowClient(),
         show_progress=True,
     )
     assert query_runner._resolve_show_progress(True) is True
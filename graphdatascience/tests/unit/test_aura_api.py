@@ -1,8 +1,11 @@
 import logging
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
 import pytest
+import requests
 from _pytest.logging import LogCaptureFixture
+from pytest_mock import MockerFixture
 from requests_mock import Mocker
 from requests_mock.request import _RequestObjectProxy
 
@@ -12,6 +15,7 @@ from graphdatascience.session.aura_api import AuraApi, AuraApiError
 from graphdatascience.session.aura_api_responses import (
     EstimationDetails,
     InstanceCreateDetails,
+    InstanceDetails,
     InstanceSpecificDetails,
     SessionDetails,
     SessionError,
@@ -30,6 +34,26 @@ def mock_auth_token(requests_mock: Mocker) -> None:
     )
 
 
+class FakeClock:
+    """
+    Stands in for the `time` module of `aura_api`, so that waiting advances a fake clock instead of the real one.
+    """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
 def test_base_uri_from_env() -> None:
     assert AuraApi.base_uri("dev") == "https://api-dev.neo4j-dev.io"
     assert AuraApi.base_uri(None) == "https://api.neo4j.io"
@@ -644,6 +668,47 @@ def test_wait_for_session_running(requests_mock: Mocker) -> None:
     api = AuraApi("", "", tenant_id="some-tenant")
 
     assert api.wait_for_session_running("id0") == WaitResult.from_connection_url("neo4j+s://foo.bar")
+    assert api.wait_for_session_running("id0", max_wait_time=0) == WaitResult.from_connection_url("neo4j+s://foo.bar")
+
+
+def test_wait_for_session_counts_request_time(
+    requests_mock: Mocker, mocker: MockerFixture, caplog: LogCaptureFixture
+) -> None:
+    mock_auth_token(requests_mock)
+    clock = FakeClock()
+    mocker.patch("graphdatascience.session.aura_api.time", clock)
+
+    def slow_response(request: _RequestObjectProxy, context: Any) -> dict[str, Any]:
+        clock.now += 0.375
+        return {
+            "data": {
+                "id": "id0",
+                "name": "name-0",
+                "status": "Creating",
+                "instance_id": "dbid-1",
+                "created_at": "1970-01-01T00:00:00Z",
+                "host": "foo.bar",
+                "memory": "4Gi",
+                "expiry_date": "1977-01-01T00:00:00Z",
+                "tenant_id": "tenant-1",
+                "user_id": "user-1",
+            }
+        }
+
+    session_mock = requests_mock.get("https://api.neo4j.io/v1beta5/data-science/sessions/id0", json=slow_response)
+
+    api = AuraApi("", "", tenant_id="some-tenant")
+
+    with caplog.at_level(logging.DEBUG):
+        assert (
+            "Session `id0` is not running after 0.5 seconds"
+            in api.wait_for_session_running("id0", max_wait_time=0.5).error
+        )
+
+    # the first poll took 0.375s, so only the remaining 0.125s are slept before the final poll at the deadline
+    assert clock.sleeps == [0.125]
+    assert session_mock.call_count == 2
+    assert caplog.text.count("Retrying in 0.125 seconds...") == 1
 
 
 def test_wait_for_session_running_until_failure(requests_mock: Mocker) -> None:
@@ -839,6 +904,45 @@ def test_auth_token_reused(requests_mock: Mocker) -> None:
     assert api._request_session.auth._auth_token() == "one_token"  # type: ignore
 
 
+def test_default_request_timeout(mocker: MockerFixture) -> None:
+    send = mocker.patch("requests.adapters.HTTPAdapter.send")
+    adapter = AuraApi._http_adapter(allowed_methods=["GET"], total_retries=1)
+    request = requests.Request("GET", "https://api.neo4j.io/v1/tenants").prepare()
+
+    adapter.send(request)
+    assert send.call_args.kwargs["timeout"] == AuraApi.REQUEST_TIMEOUT
+
+    adapter.send(request, timeout=42)
+    assert send.call_args.kwargs["timeout"] == 42
+
+
+def test_close(mocker: MockerFixture) -> None:
+    api = AuraApi(client_id="", client_secret="", tenant_id="some-tenant")
+    close = mocker.patch("requests.Session.close")
+
+    api.close()
+
+    # both the API session and the OAuth session
+    assert close.call_count == 2
+
+
+def test_auth_header_sent(requests_mock: Mocker) -> None:
+    api = AuraApi(client_id="", client_secret="", tenant_id="some-tenant")
+
+    mock_auth_token(requests_mock)
+    requests_mock.get("https://api.neo4j.io/v1/instances/id0", status_code=404)
+
+    api.list_instance("id0")
+    api.list_instance("id0")
+
+    last_request = requests_mock.last_request
+    assert last_request is not None
+    assert last_request.headers["Authorization"] == "Bearer very_short_token"
+    assert last_request.headers["User-agent"].startswith("neo4j-graphdatascience-v")
+    # the token is fetched once and reused for the second request
+    assert len([r for r in requests_mock.request_history if r.url == "https://api.neo4j.io/oauth/token"]) == 1
+
+
 def test_auth_token_use_short_token(requests_mock: Mocker) -> None:
     api = AuraApi(client_id="", client_secret="", tenant_id="some-tenant")
 
@@ -909,6 +1013,26 @@ def test_list_instance(requests_mock: Mocker) -> None:
     assert result.type == "enterprise-db"
 
 
+def test_list_instances(requests_mock: Mocker) -> None:
+    api = AuraApi(client_id="", client_secret="", tenant_id="YOUR_TENANT_ID")
+
+    mock_auth_token(requests_mock)
+    requests_mock.get(
+        "https://api.neo4j.io/v1/instances?tenantId=YOUR_TENANT_ID",
+        json={
+            "data": [
+                {"id": "id0", "name": "Production", "tenant_id": "YOUR_TENANT_ID", "cloud_provider": "gcp"},
+                {"id": "id1", "name": "Staging", "tenant_id": "YOUR_TENANT_ID", "cloud_provider": "aws"},
+            ]
+        },
+    )
+
+    assert api.list_instances() == [
+        InstanceDetails(id="id0", name="Production", tenant_id="YOUR_TENANT_ID", cloud_provider="gcp"),
+        InstanceDetails(id="id1", name="Staging", tenant_id="YOUR_TENANT_ID", cloud_provider="aws"),
+    ]
+
+
 def test_list_instance_missing_memory_field(requests_mock: Mocker) -> None:
     api = AuraApi(client_id="", client_secret="", tenant_id="some-tenant")
 
@@ -981,6 +1105,45 @@ def test_dont_wait_forever(requests_mock: Mocker, caplog: LogCaptureFixture) ->
     assert "Instance `id0` is not yet running. Current status: creating. Retrying in 0.2 seconds..." in caplog.text
 
 
+def test_wait_for_instance_counts_request_time(
+    requests_mock: Mocker, mocker: MockerFixture, caplog: LogCaptureFixture
+) -> None:
+    mock_auth_token(requests_mock)
+    clock = FakeClock()
+    mocker.patch("graphdatascience.session.aura_api.time", clock)
+
+    def slow_response(request: _RequestObjectProxy, context: Any) -> dict[str, Any]:
+        clock.now += 0.375
+        return {
+            "data": {
+                "status": "creating",
+                "cloud_provider": None,
+                "connection_url": None,
+                "id": None,
+                "name": None,
+                "region": None,
+                "tenant_id": None,
+                "type": None,
+                "memory": "4Gi",
+            }
+        }
+
+    instance_mock = requests_mock.get("https://api.neo4j.io/v1/instances/id0", json=slow_response)
+
+    api = AuraApi("", "", tenant_id="some-tenant")
+
+    with caplog.at_level(logging.DEBUG):
+        assert (
+            "Instance is not running after waiting for 0.5"
+            in api.wait_for_instance_running("id0", max_wait_time=0.5).error
+        )
+
+    # the first poll took 0.375s, so only the remaining 0.125s are slept before the final poll at the deadline
+    assert clock.sleeps == [0.125]
+    assert instance_mock.call_count == 2
+    assert caplog.text.count("Retrying in 0.125 seconds...") == 1
+
+
 def test_wait_for_instance_running(requests_mock: Mocker) -> None:
     mock_auth_token(requests_mock)
     requests_mock.get(
@@ -1003,6 +1166,7 @@ def test_wait_for_instance_running(requests_mock: Mocker) -> None:
     api = AuraApi("", "", tenant_id="some-tenant")
 
     assert api.wait_for_instance_running("id0") == WaitResult.from_connection_url("foo.bar")
+    assert api.wait_for_instance_running("id0", max_wait_time=0) == WaitResult.from_connection_url("foo.bar")
 
 
 def test_wait_for_instance_deleting(requests_mock: Mocker) -> None:
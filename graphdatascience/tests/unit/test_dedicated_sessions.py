@@ -641,6 +641,14 @@ def test_delete_nonexisting_session(aura_api: AuraApi) -> None:
     assert [i.name for i in sessions.list()] == ["one"]
 
 
+def test_close(mocker: MockerFixture, aura_api: AuraApi) -> None:
+    close = mocker.patch.object(aura_api, "close")
+
+    DedicatedSessions(aura_api).close()
+
+    close.assert_called_once()
+
+
 def test_delete_session_paused_instance(aura_api: AuraApi) -> None:
     fake_aura_api = cast(FakeAuraApi, aura_api)
 
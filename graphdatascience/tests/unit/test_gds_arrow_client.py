@@ -1,6 +1,8 @@
 import json
+import pickle
 import re
-from typing import Any, Generator, Union
+from types import MappingProxyType
+from typing import Any, Generator, Mapping, Union
 
 import pyarrow as pa
 import pytest
@@ -12,6 +14,40 @@ from graphdatascience.query_runner.gds_arrow_client import AuthMiddleware, GdsAr
 
 ActionParam = Union[str, tuple[str, Any], Action]
 
+GRAPH_NOT_FOUND_ERROR = re.compile(
+    r"FlightServerError: UNKNOWN: Graph with name `people-and-fruits` does not exist on database `neo4j`\. "
+    r"It might exist on another database\."
+)
+UNEXPECTED_CONFIGURATION_KEY_ERROR = re.compile(
+    re.escape("FlightServerError: UNKNOWN: Unexpected configuration key(s): [undirectedRelationshipTypes]")
+)
+
+CREATE_GRAPH_DEFAULTS_BODY = MappingProxyType({"name": "g", "database_name": "DB"})
+CREATE_GRAPH_OPTIONS_BODY = MappingProxyType(
+    {
+        "concurrency": 42,
+        "database_name": "DB",
+        "inverse_indexed_relationship_types": ["Bar"],
+        "name": "g",
+        "undirected_relationship_types": ["Foo"],
+    }
+)
+CREATE_DATABASE_DEFAULTS_BODY = MappingProxyType(
+    {"name": "g", "force": False, "high_io": False, "use_bad_collector": False}
+)
+CREATE_DATABASE_OPTIONS_BODY = MappingProxyType(
+    {
+        "concurrency": 42,
+        "db_format": "BLOCK",
+        "force": True,
+        "high_io": True,
+        "id_property": "foo",
+        "id_type": "DB",
+        "name": "g",
+        "use_bad_collector": True,
+    }
+)
+
 
 class FlightServer(flight.FlightServerBase):  # type: ignore
     def __init__(self, location: str = "grpc://0.0.0.0:0", **kwargs: dict[str, Any]) -> None:
@@ -19,6 +55,16 @@ class FlightServer(flight.FlightServerBase):  # type: ignore
         self._location: str = location
         self._actions: list[ActionParam] = []
         self._tickets: list[Ticket] = []
+        # the responses are fixed per action, so encode them once instead of on every call
+        responses: dict[str, dict[str, Any]] = {
+            "CREATE_GRAPH": {"name": "g"},
+            "CREATE_GRAPH_FROM_TRIPLETS": {"name": "g"},
+            "CREATE_DATABASE": {"name": "g"},
+            "NODE_LOAD_DONE": {"name": "g", "node_count": 42},
+            "RELATIONSHIP_LOAD_DONE": {"name": "g", "relationship_count": 42},
+            "TRIPLET_LOAD_DONE": {"name": "g", "node_count": 42, "relationship_count": 1337},
+        }
+        self._responses = {action_type: json.dumps(body).encode("utf-8") for action_type, body in responses.items()}
 
     def do_get(self, context: Any, ticket: Ticket) -> GeneratorStream:
         self._tickets.append(ticket)
@@ -35,37 +81,36 @@ class FlightServer(flight.FlightServerBase):  # type: ignore
         elif isinstance(action, str):
             actionType = action
 
-        response: dict[str, Any] = {}
-        if "CREATE" in actionType:
-            response = {"name": "g"}
-        elif "NODE_LOAD_DONE" in actionType:
-            response = {"name": "g", "node_count": 42}
-        elif "RELATIONSHIP_LOAD_DONE" in actionType:
-            response = {"name": "g", "relationship_count": 42}
-        elif "TRIPLET_LOAD_DONE" in actionType:
-            response = {"name": "g", "node_count": 42, "relationship_count": 1337}
-        else:
-            response = {}
-        return [json.dumps(response).encode("utf-8")]
-
-
-@pytest.fixture()
+        # strip the endpoint version prefix, e.g. `v1/`
+        return [self._responses.get(actionType.rsplit("/", 1)[-1], b"{}")]
+
+
+@pytest.fixture(scope="module")
 def flight_server() -> Generator[None, FlightServer, None]:
     with FlightServer() as server:
         yield server
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def flight_client(flight_server: FlightServer) -> Generator[GdsArrowClient, None, None]:
     with GdsArrowClient("localhost", flight_server.port) as client:
         yield client
 
 
+@pytest.fixture(autouse=True)
+def reset_flight_server(request: pytest.FixtureRequest) -> None:
+    # the server is shared by the whole module, so only start it for tests that use it
+    if "flight_server" in request.fixturenames:
+        server: FlightServer = request.getfixturevalue("flight_server")
+        server._actions.clear()
+        server._tickets.clear()
+
+
 def test_create_graph_with_defaults(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
     flight_client.create_graph("g", "DB")
     actions = flight_server._actions
     assert len(actions) == 1
-    assert_action(actions[0], "v1/CREATE_GRAPH", {"name": "g", "database_name": "DB"})
+    assert_action(actions[0], "v1/CREATE_GRAPH", CREATE_GRAPH_DEFAULTS_BODY)
 
 
 def test_create_graph_with_options(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
@@ -74,24 +119,14 @@ def test_create_graph_with_options(flight_server: FlightServer, flight_client: G
     )
     actions = flight_server._actions
     assert len(actions) == 1
-    assert_action(
-        actions[0],
-        "v1/CREATE_GRAPH",
-        {
-            "concurrency": 42,
-            "database_name": "DB",
-            "inverse_indexed_relationship_types": ["Bar"],
-            "name": "g",
-            "undirected_relationship_types": ["Foo"],
-        },
-    )
+    assert_action(actions[0], "v1/CREATE_GRAPH", CREATE_GRAPH_OPTIONS_BODY)
 
 
 def test_create_graph_from_triplets_with_defaults(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
     flight_client.create_graph_from_triplets("g", "DB")
     actions = flight_server._actions
     assert len(actions) == 1
-    assert_action(actions[0], "v1/CREATE_GRAPH_FROM_TRIPLETS", {"name": "g", "database_name": "DB"})
+    assert_action(actions[0], "v1/CREATE_GRAPH_FROM_TRIPLETS", CREATE_GRAPH_DEFAULTS_BODY)
 
 
 def test_create_graph_from_triplets_with_options(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
@@ -100,26 +135,14 @@ def test_create_graph_from_triplets_with_options(flight_server: FlightServer, fl
     )
     actions = flight_server._actions
     assert len(actions) == 1
-    assert_action(
-        actions[0],
-        "v1/CREATE_GRAPH_FROM_TRIPLETS",
-        {
-            "concurrency": 42,
-            "database_name": "DB",
-            "inverse_indexed_relationship_types": ["Bar"],
-            "name": "g",
-            "undirected_relationship_types": ["Foo"],
-        },
-    )
+    assert_action(actions[0], "v1/CREATE_GRAPH_FROM_TRIPLETS", CREATE_GRAPH_OPTIONS_BODY)
 
 
 def test_create_database_with_defaults(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
     flight_client.create_database("g")
     actions = flight_server._actions
     assert len(actions) == 1
-    assert_action(
-        actions[0], "v1/CREATE_DATABASE", {"name": "g", "force": False, "high_io": False, "use_bad_collector": False}
-    )
+    assert_action(actions[0], "v1/CREATE_DATABASE", CREATE_DATABASE_DEFAULTS_BODY)
 
 
 def test_create_database_with_options(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
@@ -135,20 +158,7 @@ def test_create_database_with_options(flight_server: FlightServer, flight_client
     )
     actions = flight_server._actions
     assert len(actions) == 1
-    assert_action(
-        actions[0],
-        "v1/CREATE_DATABASE",
-        {
-            "concurrency": 42,
-            "db_format": "BLOCK",
-            "force": True,
-            "high_io": True,
-            "id_property": "foo",
-            "id_type": "DB",
-            "name": "g",
-            "use_bad_collector": True,
-        },
-    )
+    assert_action(actions[0], "v1/CREATE_DATABASE", CREATE_DATABASE_OPTIONS_BODY)
 
 
 def test_node_load_done_action(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
@@ -187,7 +197,9 @@ def test_abort_action(flight_server: FlightServer, flight_client: GdsArrowClient
 
 
 def test_get_node_property(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
-    flight_client.get_node_properties("g", "db", "id", ["Person"], concurrency=42)
+    result = flight_client.get_node_properties("g", "db", "id", ["Person"], concurrency=42)
+    assert result["ids"].tolist() == [42, 1337, 1234]
+
     tickets = flight_server._tickets
     assert len(tickets) == 1
     assert_ticket(
@@ -286,6 +298,24 @@ def test_get_relationship_topologys(flight_server: FlightServer, flight_client:
     )
 
 
+def test_reconnects_after_close(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
+    flight_client.abort("g")
+    flight_client.close()
+    flight_client.abort("g")
+
+    assert len(flight_server._actions) == 2
+
+
+def test_close_after_unpickling(flight_server: FlightServer, flight_client: GdsArrowClient) -> None:
+    unpickled_client: GdsArrowClient = pickle.loads(pickle.dumps(flight_client))
+    unpickled_client.close()
+
+    unpickled_client.abort("g")
+    unpickled_client.close()
+
+    assert len(flight_server._actions) == 1
+
+
 def test_auth_middleware() -> None:
     middleware = AuthMiddleware(("user", "password"))
 
@@ -315,7 +345,7 @@ def test_auth_middleware_bad_headers() -> None:
 def test_handle_flight_error() -> None:
     with pytest.raises(
         flight.FlightServerError,
-        match="FlightServerError: UNKNOWN: Graph with name `people-and-fruits` does not exist on database `neo4j`. It might exist on another database.",
+        match=GRAPH_NOT_FOUND_ERROR,
     ):
         GdsArrowClient.handle_flight_error(
             flight.FlightServerError(
@@ -325,7 +355,7 @@ def test_handle_flight_error() -> None:
 
     with pytest.raises(
         flight.FlightServerError,
-        match=re.escape("FlightServerError: UNKNOWN: Unexpected configuration key(s): [undirectedRelationshipTypes]"),
+        match=UNEXPECTED_CONFIGURATION_KEY_ERROR,
     ):
         GdsArrowClient.handle_flight_error(
             flight.FlightServerError(
@@ -334,12 +364,12 @@ def test_handle_flight_error() -> None:
         )
 
 
-def assert_action(action: Action, expected_type: str, expected_body: dict[str, Any]) -> None:
+def assert_action(action: Action, expected_type: str, expected_body: Mapping[str, Any]) -> None:
     assert action.type == expected_type
-    assert json.loads(action.body.to_pybytes().decode()) == expected_body
+    assert json.loads(action.body.to_pybytes()) == expected_body
 
 
 def assert_ticket(ticket: Ticket, expected_body: dict[str, Any]) -> None:
-    parsed = json.loads(ticket.ticket.decode())
+    parsed = json.loads(ticket.ticket)
     assert parsed["name"] == "GET_COMMAND"
     assert parsed["body"] == expected_body
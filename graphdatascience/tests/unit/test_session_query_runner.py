@@ -1,3 +1,7 @@
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
+
+import pytest
 from pandas import DataFrame
 
 from graphdatascience import ServerVersion
@@ -7,41 +11,39 @@ from graphdatascience.tests.unit.conftest import CollectingQueryRunner
 
 
 class FakeArrowClient:
-    def connection_info(self) -> tuple[str, str]:
-        return "myHost", "1234"
+    __slots__ = ()
+
+    def connection_info(self) -> tuple[str, int]:
+        return "myHost", 1234
 
     def request_token(self) -> str:
         return "myToken"
 
+    def close(self) -> None:
+        pass
 
-def test_extracts_parameters_projection_v1() -> None:
-    version = ServerVersion(2, 7, 0)
-    db_query_runner = CollectingQueryRunner(version, result_mock=DataFrame([{"version": "v1"}]))
-    gds_query_runner = CollectingQueryRunner(version)
-    gds_query_runner.set__mock_result(DataFrame([{"databaseLocation": "remote"}]))
-    qr = SessionQueryRunner.create(gds_query_runner, db_query_runner, FakeArrowClient(), True)  # type: ignore
 
-    qr.call_procedure(
-        endpoint="gds.arrow.project",
-        params=CallParameters(
-            graph_name="g",
-            query="RETURN 1",
-            concurrency=2,
-            undirected_relationship_types=[],
-            inverse_indexed_relationship_types=[],
-            arrow_configuration={"batchSize": 100},
-        ),
-    )
+# stateless, so one instance can serve all tests
+FAKE_ARROW_CLIENT = FakeArrowClient()
 
-    # doesn't run anything on GDS
-    assert gds_query_runner.last_query() == ""
-    assert gds_query_runner.last_params() == {}
-    assert (
-        db_query_runner.last_query()
-        == "CALL gds.arrow.project($graph_name, $query, $concurrency, \
-$undirected_relationship_types, $inverse_indexed_relationship_types, $arrow_configuration)"
-    )
-    assert db_query_runner.last_params() == {
+QueryRunners = tuple[SessionQueryRunner, CollectingQueryRunner, CollectingQueryRunner]
+
+PROTOCOL_V1_RESULT = DataFrame({"version": ["v1"]})
+PROTOCOL_V2_RESULT = DataFrame({"version": ["v1", "v2"]})
+REMOTE_GRAPH_RESULT = DataFrame({"databaseLocation": ["remote"]})
+
+PROJECT_V1_QUERY = (
+    "CALL gds.arrow.project($graph_name, $query, $concurrency, "
+    "$undirected_relationship_types, $inverse_indexed_relationship_types, $arrow_configuration)"
+)
+PROJECT_V2_QUERY = "CALL gds.arrow.project.v2($graph_name, $query, $arrow_configuration, $configuration)"
+WRITE_V1_QUERY = "CALL gds.arrow.write($graphName, $databaseName, $jobId, $arrowConfiguration)"
+WRITE_V2_QUERY = "CALL gds.arrow.write.v2($graphName, $jobId, $arrowConfiguration, $configuration)"
+DEGREE_WRITE_QUERY = "CALL gds.degree.write($graph_name, $config)"
+NODE_PROPERTIES_WRITE_QUERY = "CALL gds.graph.nodeProperties.write($graph_name, $properties, $entities, $config)"
+
+EXPECTED_PROJECTION_V1_PARAMS = MappingProxyType(
+    {
         "graph_name": "g",
         "query": "RETURN 1",
         "concurrency": 2,
@@ -50,51 +52,20 @@ $undirected_relationship_types, $inverse_indexed_relationship_types, $arrow_conf
         "arrow_configuration": {
             "encrypted": False,
             "host": "myHost",
-            "port": "1234",
+            "port": 1234,
             "token": "myToken",
             "batchSize": 100,
         },
     }
-
-
-def test_extracts_parameters_projection_v2() -> None:
-    version = ServerVersion(2, 7, 0)
-    db_query_runner = CollectingQueryRunner(version, result_mock=DataFrame([{"version": "v1"}, {"version": "v2"}]))
-    gds_query_runner = CollectingQueryRunner(version)
-    gds_query_runner.set__mock_result(DataFrame([{"databaseLocation": "remote"}]))
-    qr = SessionQueryRunner.create(
-        gds_query_runner,
-        db_query_runner,
-        FakeArrowClient(),  # type: ignore
-        True,
-    )
-
-    qr.call_procedure(
-        endpoint="gds.arrow.project",
-        params=CallParameters(
-            graph_name="g",
-            query="RETURN 1",
-            concurrency=2,
-            undirected_relationship_types=["FOO"],
-            inverse_indexed_relationship_types=[],
-            arrow_configuration={"batchSize": 100},
-        ),
-    )
-
-    # doesn't run anything on GDS
-    assert gds_query_runner.last_query() == ""
-    assert gds_query_runner.last_params() == {}
-    assert (
-        db_query_runner.last_query()
-        == "CALL gds.arrow.project.v2($graph_name, $query, $arrow_configuration, $configuration)"
-    )
-    assert db_query_runner.last_params() == {
+)
+EXPECTED_PROJECTION_V2_PARAMS = MappingProxyType(
+    {
         "graph_name": "g",
         "query": "RETURN 1",
         "arrow_configuration": {
             "encrypted": False,
             "host": "myHost",
-            "port": "1234",
+            "port": 1234,
             "token": "myToken",
             "batchSize": 100,
         },
@@ -104,72 +75,158 @@ def test_extracts_parameters_projection_v2() -> None:
             "undirectedRelationshipTypes": ["FOO"],
         },
     }
-
-
-def test_extracts_parameters_algo_write_v1() -> None:
-    version = ServerVersion(2, 7, 0)
-    db_query_runner = CollectingQueryRunner(version, result_mock=DataFrame([{"version": "v1"}]))
-    gds_query_runner = CollectingQueryRunner(version)
-    gds_query_runner.set__mock_result(DataFrame([{"databaseLocation": "remote"}]))
-    qr = SessionQueryRunner.create(gds_query_runner, db_query_runner, FakeArrowClient(), True)  # type: ignore
-
-    qr.call_procedure(endpoint="gds.degree.write", params=CallParameters(graph_name="g", config={"jobId": "my-job"}))
-
-    assert gds_query_runner.last_query() == "CALL gds.degree.write($graph_name, $config)"
-    assert gds_query_runner.last_params() == {
-        "graph_name": "g",
-        "config": {"jobId": "my-job", "writeToResultStore": True},
+)
+EXPECTED_WRITE_V1_PARAMS = MappingProxyType(
+    {
+        "graphName": "g",
+        "databaseName": "dummy",
+        "jobId": "my-job",
+        "arrowConfiguration": {"encrypted": False, "host": "myHost", "port": 1234, "token": "myToken"},
     }
-    assert (
-        db_query_runner.last_query() == "CALL gds.arrow.write($graphName, $databaseName, $jobId, $arrowConfiguration)"
-    )
-    assert db_query_runner.last_params() == {
+)
+EXPECTED_WRITE_V2_PARAMS = MappingProxyType(
+    {
+        "graphName": "g",
+        "jobId": "my-job",
+        "arrowConfiguration": {"encrypted": False, "host": "myHost", "port": 1234, "token": "myToken"},
+        "configuration": {"concurrency": 2},
+    }
+)
+EXPECTED_DEGREE_WRITE_ARROW_CONFIGURATION_PARAMS = MappingProxyType(
+    {
         "graphName": "g",
         "databaseName": "dummy",
         "jobId": "my-job",
-        "arrowConfiguration": {"encrypted": False, "host": "myHost", "port": "1234", "token": "myToken"},
+        "arrowConfiguration": {
+            "encrypted": False,
+            "host": "myHost",
+            "port": 1234,
+            "token": "myToken",
+            "batchSize": 1000,
+        },
     }
+)
+EXPECTED_NODE_PROPERTIES_WRITE_ARROW_CONFIGURATION_PARAMS = MappingProxyType(
+    {
+        "graphName": "g",
+        "databaseName": "dummy",
+        "jobId": "my-job",
+        "arrowConfiguration": {
+            "encrypted": False,
+            "host": "myHost",
+            "port": 1234,
+            "token": "myToken",
+            "batchSize": 42,
+        },
+    }
+)
 
 
-def test_extracts_parameters_algo_write_v2() -> None:
+@pytest.fixture(scope="module")
+def create_query_runners() -> Callable[..., QueryRunners]:
     version = ServerVersion(2, 7, 0)
-    db_query_runner = CollectingQueryRunner(version, result_mock=DataFrame([{"version": "v1"}, {"version": "v2"}]))
-    gds_query_runner = CollectingQueryRunner(version)
-    gds_query_runner.set__mock_result(DataFrame([{"databaseLocation": "remote"}]))
-    qr = SessionQueryRunner.create(
-        gds_query_runner,
-        db_query_runner,
-        FakeArrowClient(),  # type: ignore
-        True,
-    )
+
+    # the collecting runners record the queries of a single test, so a fresh set is created per call
+    def create(protocol_v2: bool = False) -> QueryRunners:
+        protocol_versions = PROTOCOL_V2_RESULT if protocol_v2 else PROTOCOL_V1_RESULT
+        db_query_runner = CollectingQueryRunner(version, result_mock=protocol_versions)
+        gds_query_runner = CollectingQueryRunner(version)
+        # the remote write back adds columns to the gds result, so every runner needs its own copy
+        gds_query_runner.set__mock_result(REMOTE_GRAPH_RESULT.copy(deep=False))
+        qr = SessionQueryRunner.create(gds_query_runner, db_query_runner, FAKE_ARROW_CLIENT, True)
+
+        return qr, gds_query_runner, db_query_runner
+
+    return create
+
+
+@pytest.mark.parametrize(
+    "protocol_v2, undirected_relationship_types, expected_query, expected_params",
+    [
+        (
+            False,
+            [],
+            PROJECT_V1_QUERY,
+            EXPECTED_PROJECTION_V1_PARAMS,
+        ),
+        (
+            True,
+            ["FOO"],
+            PROJECT_V2_QUERY,
+            EXPECTED_PROJECTION_V2_PARAMS,
+        ),
+    ],
+    ids=["v1", "v2"],
+)
+def test_extracts_parameters_projection(
+    protocol_v2: bool,
+    undirected_relationship_types: list[str],
+    expected_query: str,
+    expected_params: Mapping[str, Any],
+    create_query_runners: Callable[..., QueryRunners],
+) -> None:
+    qr, gds_query_runner, db_query_runner = create_query_runners(protocol_v2=protocol_v2)
 
     qr.call_procedure(
-        endpoint="gds.degree.write", params=CallParameters(graph_name="g", config={"jobId": "my-job", "concurrency": 2})
+        endpoint="gds.arrow.project",
+        params=CallParameters(
+            graph_name="g",
+            query="RETURN 1",
+            concurrency=2,
+            undirected_relationship_types=undirected_relationship_types,
+            inverse_indexed_relationship_types=[],
+            arrow_configuration={"batchSize": 100},
+        ),
     )
 
-    assert gds_query_runner.last_query() == "CALL gds.degree.write($graph_name, $config)"
-    assert gds_query_runner.last_params() == {
-        "graph_name": "g",
-        "config": {"jobId": "my-job", "writeToResultStore": True, "concurrency": 2},
-    }
-    assert (
-        db_query_runner.last_query()
-        == "CALL gds.arrow.write.v2($graphName, $jobId, $arrowConfiguration, $configuration)"
-    )
-    assert db_query_runner.last_params() == {
-        "graphName": "g",
-        "jobId": "my-job",
-        "arrowConfiguration": {"encrypted": False, "host": "myHost", "port": "1234", "token": "myToken"},
-        "configuration": {"concurrency": 2},
-    }
+    # doesn't run anything on GDS
+    assert gds_query_runner.last_query() == ""
+    assert gds_query_runner.last_params() == {}
+    assert db_query_runner.last_query() == expected_query
+    assert db_query_runner.last_params() == expected_params
 
 
-def test_arrow_and_write_configuration() -> None:
-    version = ServerVersion(2, 7, 0)
-    db_query_runner = CollectingQueryRunner(version, result_mock=DataFrame([{"version": "v1"}]))
-    gds_query_runner = CollectingQueryRunner(version)
-    gds_query_runner.set__mock_result(DataFrame([{"databaseLocation": "remote"}]))
-    qr = SessionQueryRunner.create(gds_query_runner, db_query_runner, FakeArrowClient(), True)  # type: ignore
+@pytest.mark.parametrize(
+    "protocol_v2, config, expected_gds_config, expected_query, expected_params",
+    [
+        (
+            False,
+            {"jobId": "my-job"},
+            {"jobId": "my-job", "writeToResultStore": True},
+            WRITE_V1_QUERY,
+            EXPECTED_WRITE_V1_PARAMS,
+        ),
+        (
+            True,
+            {"jobId": "my-job", "concurrency": 2},
+            {"jobId": "my-job", "writeToResultStore": True, "concurrency": 2},
+            WRITE_V2_QUERY,
+            EXPECTED_WRITE_V2_PARAMS,
+        ),
+    ],
+    ids=["v1", "v2"],
+)
+def test_extracts_parameters_algo_write(
+    protocol_v2: bool,
+    config: dict[str, Any],
+    expected_gds_config: dict[str, Any],
+    expected_query: str,
+    expected_params: Mapping[str, Any],
+    create_query_runners: Callable[..., QueryRunners],
+) -> None:
+    qr, gds_query_runner, db_query_runner = create_query_runners(protocol_v2=protocol_v2)
+
+    # the runner adds keys to the config, so the parametrized dict must not be passed directly
+    qr.call_procedure(endpoint="gds.degree.write", params=CallParameters(graph_name="g", config=dict(config)))
+
+    assert gds_query_runner.last_query() == DEGREE_WRITE_QUERY
+    assert gds_query_runner.last_params() == {"graph_name": "g", "config": expected_gds_config}
+    assert db_query_runner.last_query() == expected_query
+    assert db_query_runner.last_params() == expected_params
+
+
+def test_arrow_and_write_configuration(create_query_runners: Callable[..., QueryRunners]) -> None:
+    qr, gds_query_runner, db_query_runner = create_query_runners()
 
     qr.call_procedure(
         endpoint="gds.degree.write",
@@ -179,34 +236,17 @@ def test_arrow_and_write_configuration() -> None:
         ),
     )
 
-    assert gds_query_runner.last_query() == "CALL gds.degree.write($graph_name, $config)"
+    assert gds_query_runner.last_query() == DEGREE_WRITE_QUERY
     assert gds_query_runner.last_params() == {
         "graph_name": "g",
         "config": {"writeToResultStore": True, "jobId": "my-job"},
     }
-    assert (
-        db_query_runner.last_query() == "CALL gds.arrow.write($graphName, $databaseName, $jobId, $arrowConfiguration)"
-    )
-    assert db_query_runner.last_params() == {
-        "graphName": "g",
-        "databaseName": "dummy",
-        "jobId": "my-job",
-        "arrowConfiguration": {
-            "encrypted": False,
-            "host": "myHost",
-            "port": "1234",
-            "token": "myToken",
-            "batchSize": 1000,
-        },
-    }
+    assert db_query_runner.last_query() == WRITE_V1_QUERY
+    assert db_query_runner.last_params() == EXPECTED_DEGREE_WRITE_ARROW_CONFIGURATION_PARAMS
 
 
-def test_arrow_and_write_configuration_graph_write() -> None:
-    version = ServerVersion(2, 7, 0)
-    db_query_runner = CollectingQueryRunner(version, result_mock=DataFrame([{"version": "v1"}]))
-    gds_query_runner = CollectingQueryRunner(version)
-    gds_query_runner.set__mock_result(DataFrame([{"databaseLocation": "remote"}]))
-    qr = SessionQueryRunner.create(gds_query_runner, db_query_runner, FakeArrowClient(), True)  # type: ignore
+def test_arrow_and_write_configuration_graph_write(create_query_runners: Callable[..., QueryRunners]) -> None:
+    qr, gds_query_runner, db_query_runner = create_query_runners()
 
     qr.call_procedure(
         endpoint="gds.graph.nodeProperties.write",
@@ -218,28 +258,12 @@ def test_arrow_and_write_configuration_graph_write() -> None:
         ),
     )
 
-    assert (
-        gds_query_runner.last_query()
-        == "CALL gds.graph.nodeProperties.write($graph_name, $properties, $entities, $config)"
-    )
+    assert gds_query_runner.last_query() == NODE_PROPERTIES_WRITE_QUERY
     assert gds_query_runner.last_params() == {
         "graph_name": "g",
         "entities": [],
         "properties": [],
         "config": {"writeToResultStore": True, "jobId": "my-job"},
     }
-    assert (
-        db_query_runner.last_query() == "CALL gds.arrow.write($graphName, $databaseName, $jobId, $arrowConfiguration)"
-    )
-    assert db_query_runner.last_params() == {
-        "graphName": "g",
-        "databaseName": "dummy",
-        "jobId": "my-job",
-        "arrowConfiguration": {
-            "encrypted": False,
-            "host": "myHost",
-            "port": "1234",
-            "token": "myToken",
-            "batchSize": 42,
-        },
-    }
+    assert db_query_runner.last_query() == WRITE_V1_QUERY
+    assert db_query_runner.last_params() == EXPECTED_NODE_PROPERTIES_WRITE_ARROW_CONFIGURATION_PARAMS